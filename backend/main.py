@@ -1,9 +1,10 @@
 # main.py - FastAPI Backend for Feed Monitoring Framework
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta, date
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -11,15 +12,21 @@ import sqlite3
 import yaml
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import os
+import re
+import sys
+import time
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Feed Monitoring Framework", version="1.0.0")
+app = FastAPI(title="Feed Monitoring Framework", version="1.0.0", default_response_class=ORJSONResponse)
 
 # CORS middleware
 app.add_middleware(
@@ -39,6 +46,9 @@ class FeedStatus(str, Enum):
     FAILED = "failed"
     UNKNOWN = "unknown"
 
+    def __str__(self) -> str:
+        return self.value
+
 class FeedStatusResponse(BaseModel):
     feed_name: str
     cob_date: str
@@ -47,9 +57,48 @@ class FeedStatusResponse(BaseModel):
     last_updated: datetime
     expected_time: Optional[str] = None
 
-class FeedSummaryResponse(BaseModel):
-    feed_name: str
-    daily_status: Dict[str, Dict]  # date -> {status, count, day_of_week}
+# Prefer the libyaml-backed loader when available
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml_cached(path: str, mtime: float) -> Dict:
+    """Parse a YAML file, memoized on path and modification time"""
+    with open(path, 'r') as file:
+        return yaml.load(file, Loader=_YamlLoader)
+
+DB_PATH = 'demo.db'
+
+# Table and column names are interpolated into SQL, so restrict them to plain identifiers
+_IDENTIFIER_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$')
+
+# Day-of-week abbreviations indexed by date.weekday()
+_DOW = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+def _pack_date(d: date) -> int:
+    """Encode a date as a YYYYMMDD integer for cheap dict keys"""
+    return d.year * 10000 + d.month * 100 + d.day
+
+# SQLite expression packing a date column into the same YYYYMMDD integer
+_PACKED_DATE_SQL = "CAST(strftime('%Y%m%d', {column}) AS INTEGER)"
+
+# Cached /api/feeds/status payload; cleared whenever a feed check writes new status.
+# The generation counter stops a request that read before a write from caching its stale result.
+FEEDS_STATUS_TTL_SECONDS = 60
+_feeds_status_cache: Dict = {'generation': 0}
+_feeds_status_lock = threading.Lock()
+
+def _invalidate_feeds_status():
+    """Drop the cached status summary and start a new cache generation"""
+    with _feeds_status_lock:
+        _feeds_status_cache.pop('payload', None)
+        _feeds_status_cache['generation'] += 1
+
+def create_db_connection() -> sqlite3.Connection:
+    """Open a long-lived autocommit connection to the demo database"""
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
 
 @dataclass
 class FeedConfig:
@@ -61,22 +110,50 @@ class FeedConfig:
     weekend_expected: bool
     min_records: int
     connection_string: str
+    count_sql: str = field(init=False, repr=False)
+    range_count_sql: str = field(init=False, repr=False)
+    max_rowid_sql: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Validate identifiers and build the feed's SQL once"""
+        for identifier in (self.source_table, self.date_column):
+            if not _IDENTIFIER_RE.match(identifier):
+                raise ValueError(f"Invalid SQL identifier in feed {self.name}: {identifier!r}")
+
+        self.count_sql = f"SELECT COUNT(*) FROM {self.source_table} WHERE {self.date_column} = ?"
+        packed_date = _PACKED_DATE_SQL.format(column=self.date_column)
+        # Only plain YYYY-MM-DD values, so history counts match count_sql's equality check
+        self.range_count_sql = (
+            f"SELECT {packed_date}, COUNT(*) FROM {self.source_table} "
+            f"WHERE {self.date_column} BETWEEN ? AND ? AND {self.date_column} = date({self.date_column}) "
+            f"GROUP BY {self.date_column}"
+        )
+        self.max_rowid_sql = f"SELECT MAX(rowid) FROM {self.source_table}"
 
 class FeedMonitor:
     def __init__(self, config_path: str = "config/feeds.yaml"):
         self.config_path = config_path
         self.feeds_config = self.load_config()
+        self.conn = create_db_connection()
+        self.db_lock = threading.Lock()
+        self._local = threading.local()
+        # Every per-thread connection, so shutdown can close them
+        self._thread_conns: List[sqlite3.Connection] = []
+        # feed name -> (cob_date, source MAX(rowid)) as of the last successful check
+        self._last_seen: Dict[str, Tuple[date, int]] = {}
+        # Long-lived workers keep their thread-local connections across scheduler ticks
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="feed-check")
         self.init_database()
         
     def load_config(self) -> List[FeedConfig]:
         """Load feed configurations from YAML file"""
         try:
-            with open(self.config_path, 'r') as file:
-                config_data = yaml.safe_load(file)
-                feeds = []
-                for feed_data in config_data.get('feeds', []):
-                    feeds.append(FeedConfig(**feed_data))
-                return feeds
+            mtime = os.path.getmtime(self.config_path)
+            config_data = _parse_yaml_cached(self.config_path, mtime)
+            feeds = []
+            for feed_data in config_data.get('feeds', []):
+                feeds.append(FeedConfig(**feed_data))
+            return feeds
         except FileNotFoundError:
             logger.warning(f"Config file {self.config_path} not found. Using default config.")
             return self.get_default_config()
@@ -118,9 +195,15 @@ class FeedMonitor:
     
     def init_database(self):
         """Initialize SQLite database for demo and monitoring metadata"""
-        conn = sqlite3.connect('demo.db')
-        cursor = conn.cursor()
-        
+        cursor = self.conn.cursor()
+
+        # WAL lets readers run alongside the scheduler's writes
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+
+        # The shared connection autocommits, so group the setup into one transaction
+        cursor.execute("BEGIN")
+
         # Create demo tables
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS customer_transactions (
@@ -165,18 +248,30 @@ class FeedMonitor:
                 UNIQUE(feed_name, cob_date)
             )
         ''')
-        
+
+        # Index source date columns; feed_status is already covered by its UNIQUE constraint
+        for feed_config in self.feeds_config:
+            try:
+                cursor.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{feed_config.source_table}_{feed_config.date_column} "
+                    f"ON {feed_config.source_table}({feed_config.date_column})"
+                )
+            except sqlite3.OperationalError as e:
+                logger.warning(f"Could not index {feed_config.source_table}.{feed_config.date_column}: {str(e)}")
+
         # Insert sample data for demo
         self.insert_sample_data(cursor)
         
-        conn.commit()
-        conn.close()
+        cursor.execute("COMMIT")
     
     def insert_sample_data(self, cursor):
         """Insert sample data for demonstration"""
-        import random
+        import numpy as np
+        from itertools import repeat
         from datetime import datetime, timedelta
         
+        rng = np.random.default_rng()
+        
         # Generate data for last 10 days
         end_date = datetime.now().date()
         
@@ -184,47 +279,71 @@ class FeedMonitor:
             current_date = end_date - timedelta(days=i)
             
             # Customer transactions (skip weekends sometimes)
-            if current_date.weekday() < 5 or random.random() > 0.3:
-                count = random.randint(800, 1500)
-                for j in range(count):
-                    cursor.execute('''
-                        INSERT OR IGNORE INTO customer_transactions 
-                        (transaction_date, customer_id, amount) 
-                        VALUES (?, ?, ?)
-                    ''', (current_date, random.randint(1, 1000), random.uniform(10, 500)))
+            if current_date.weekday() < 5 or rng.random() > 0.3:
+                count = int(rng.integers(800, 1501))
+                customer_ids = rng.integers(1, 1001, size=count).tolist()
+                amounts = rng.uniform(10, 500, size=count).tolist()
+                rows = zip(repeat(current_date, count), customer_ids, amounts)
+                cursor.executemany('''
+                    INSERT OR IGNORE INTO customer_transactions 
+                    (transaction_date, customer_id, amount) 
+                    VALUES (?, ?, ?)
+                ''', rows)
             
             # Product catalog (daily updates)
-            count = random.randint(80, 150)
-            for j in range(count):
-                cursor.execute('''
-                    INSERT OR IGNORE INTO product_catalog 
-                    (update_date, product_name, price) 
-                    VALUES (?, ?, ?)
-                ''', (current_date, f"Product_{j}", random.uniform(5, 200)))
+            count = int(rng.integers(80, 151))
+            prices = rng.uniform(5, 200, size=count).tolist()
+            rows = ((current_date, f"Product_{j}", price) for j, price in enumerate(prices))
+            cursor.executemany('''
+                INSERT OR IGNORE INTO product_catalog 
+                (update_date, product_name, price) 
+                VALUES (?, ?, ?)
+            ''', rows)
             
             # Orders (skip weekends)
             if current_date.weekday() < 5:
-                count = random.randint(400, 800)
-                for j in range(count):
-                    cursor.execute('''
-                        INSERT OR IGNORE INTO orders 
-                        (order_date, customer_id, total) 
-                        VALUES (?, ?, ?)
-                    ''', (current_date, random.randint(1, 1000), random.uniform(20, 300)))
+                count = int(rng.integers(400, 801))
+                customer_ids = rng.integers(1, 1001, size=count).tolist()
+                totals = rng.uniform(20, 300, size=count).tolist()
+                rows = zip(repeat(current_date, count), customer_ids, totals)
+                cursor.executemany('''
+                    INSERT OR IGNORE INTO orders 
+                    (order_date, customer_id, total) 
+                    VALUES (?, ?, ?)
+                ''', rows)
+    
+    def get_thread_connection(self) -> sqlite3.Connection:
+        """Return a connection owned by the calling thread"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = create_db_connection()
+            with self.db_lock:
+                self._thread_conns.append(conn)
+        return conn
+    
+    def close_thread_connections(self):
+        """Close the per-thread connections opened by get_thread_connection"""
+        with self.db_lock:
+            for conn in self._thread_conns:
+                conn.close()
+            self._thread_conns.clear()
     
     def check_feed_status(self, feed_config: FeedConfig, cob_date: date) -> FeedStatusResponse:
         """Check status of a specific feed for given COB date"""
         try:
-            conn = sqlite3.connect('demo.db')
-            cursor = conn.cursor()
+            cursor = self.get_thread_connection().cursor()
             
-            # Count records for the COB date
-            query = f"SELECT COUNT(*) FROM {feed_config.source_table} WHERE {feed_config.date_column} = ?"
-            cursor.execute(query, (cob_date,))
-            record_count = cursor.fetchone()[0]
-            
-            # Determine status
-            status = self.determine_status(feed_config, cob_date, record_count)
+            if cob_date.weekday() >= 5 and not feed_config.weekend_expected:
+                # Not expected on weekends, so the count cannot change the status
+                record_count = 0
+                status = FeedStatus.RECEIVED
+            else:
+                # Count records for the COB date
+                cursor.execute(feed_config.count_sql, (cob_date,))
+                record_count = cursor.fetchone()[0]
+                
+                # Determine status
+                status = self.determine_status(feed_config, cob_date, record_count)
             
             # Update feed status table
             cursor.execute('''
@@ -233,9 +352,7 @@ class FeedMonitor:
                 VALUES (?, ?, ?, ?, ?, ?)
             ''', (feed_config.name, cob_date, status.value, record_count, 
                   datetime.now(), feed_config.expected_time))
-            
-            conn.commit()
-            conn.close()
+            _invalidate_feeds_status()
             
             return FeedStatusResponse(
                 feed_name=feed_config.name,
@@ -261,7 +378,7 @@ class FeedMonitor:
         """Determine feed status based on configuration and data"""
         # Check if it's weekend and feed is not expected
         if cob_date.weekday() >= 5 and not feed_config.weekend_expected:
-            return FeedStatus.RECEIVED if record_count == 0 else FeedStatus.RECEIVED
+            return FeedStatus.RECEIVED
         
         # Check minimum records threshold
         if record_count == 0:
@@ -276,12 +393,39 @@ class FeedMonitor:
         yesterday = datetime.now().date() - timedelta(days=1)
         logger.info(f"Checking all feeds for COB date: {yesterday}")
         
+        # Only re-count feeds whose source table has gained rows since the last check
+        pending = []
         for feed_config in self.feeds_config:
+            max_rowid = self.get_max_rowid(feed_config)
+            if max_rowid is not None and self._last_seen.get(feed_config.name) == (yesterday, max_rowid):
+                logger.info(f"Feed {feed_config.name}: no new data since last check")
+                continue
+            pending.append((feed_config, max_rowid))
+        
+        if not pending:
+            return
+        
+        # Feeds are independent and IO-bound, so check them concurrently
+        futures = {
+            self._executor.submit(self.check_feed_status, feed_config, yesterday): (feed_config, max_rowid)
+            for feed_config, max_rowid in pending
+        }
+        for future, (feed_config, max_rowid) in futures.items():
             try:
-                result = self.check_feed_status(feed_config, yesterday)
+                result = future.result()
                 logger.info(f"Feed {feed_config.name}: {result.status} ({result.record_count} records)")
+                if result.status != FeedStatus.FAILED and max_rowid is not None:
+                    self._last_seen[feed_config.name] = (yesterday, max_rowid)
             except Exception as e:
                 logger.error(f"Failed to check feed {feed_config.name}: {str(e)}")
+    
+    def get_max_rowid(self, feed_config: FeedConfig) -> Optional[int]:
+        """Return the source table's highest rowid, or None if it cannot be read"""
+        try:
+            return self.get_thread_connection().execute(feed_config.max_rowid_sql).fetchone()[0]
+        except sqlite3.Error as e:
+            logger.debug(f"Could not read MAX(rowid) for {feed_config.source_table}: {str(e)}")
+            return None
 
 # Initialize monitor
 monitor = FeedMonitor()
@@ -307,63 +451,89 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     scheduler.shutdown()
+    monitor._executor.shutdown(wait=True)
+    monitor.close_thread_connections()
+    monitor.conn.close()
+
+def get_db_connection() -> sqlite3.Connection:
+    """Dependency returning the shared demo database connection"""
+    return monitor.conn
 
 @app.get("/")
 async def root():
     return {"message": "Feed Monitoring Framework API", "version": "1.0.0"}
 
-@app.get("/api/feeds/status", response_model=List[FeedSummaryResponse])
-async def get_feeds_status():
+# Summary is built from trusted data, so skip response model validation
+@app.get("/api/feeds/status", response_model=None)
+def get_feeds_status(conn: sqlite3.Connection = Depends(get_db_connection)):
     """Get 90 days status summary for all feeds"""
     try:
-        conn = sqlite3.connect('demo.db')
-        cursor = conn.cursor()
+        cached = _feeds_status_cache.get('payload')
+        if cached is not None and _feeds_status_cache.get('expires', 0) > time.monotonic():
+            return cached
+        generation = _feeds_status_cache['generation']
         
         # Get last 90 days
         end_date = datetime.now().date()
         start_date = end_date - timedelta(days=90)
         
+        # Generate all dates in range once and share them across feeds
+        dates = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        packed_dates = [_pack_date(d) for d in dates]
+        date_keys = [d.isoformat() for d in dates]
+        
         feeds_summary = []
         
         for feed_config in monitor.feeds_config:
+            with monitor.db_lock:
+                cursor = conn.cursor()
+
+                # Load stored status for the whole range in one query
+                cursor.execute(f'''
+                    SELECT {_PACKED_DATE_SQL.format(column='cob_date')}, status, record_count FROM feed_status
+                    WHERE feed_name = ? AND cob_date BETWEEN ? AND ?
+                ''', (feed_config.name, start_date, end_date))
+                # Consume plain tuple rows straight off the cursor; intern statuses so
+                # rows share the enum's string objects
+                stored_status = {
+                    packed_date: (sys.intern(status), count)
+                    for packed_date, status, count in cursor
+                }
+
+                # Count historical source records per date with a single grouped query
+                counts_by_date = {}
+                if len(stored_status) < len(dates):
+                    counts_by_date = dict(cursor.execute(feed_config.range_count_sql, (start_date, end_date)))
+
             daily_status = {}
-            
-            # Generate all dates in range
-            current_date = start_date
-            while current_date <= end_date:
-                day_name = current_date.strftime('%A')[:3]  # Mon, Tue, etc.
-                
+            for current_date, packed_date, date_key in zip(dates, packed_dates, date_keys):
+                weekday = current_date.weekday()
+
                 # Check if we have status data
-                cursor.execute('''
-                    SELECT status, record_count FROM feed_status 
-                    WHERE feed_name = ? AND cob_date = ?
-                ''', (feed_config.name, current_date))
-                
-                result = cursor.fetchone()
+                result = stored_status.get(packed_date)
                 if result:
                     status, count = result
                 else:
-                    # If no data, check actual table for historical data
-                    query = f"SELECT COUNT(*) FROM {feed_config.source_table} WHERE {feed_config.date_column} = ?"
-                    cursor.execute(query, (current_date,))
-                    count = cursor.fetchone()[0]
+                    # If no data, fall back to historical counts from the source table
+                    count = counts_by_date.get(packed_date, 0)
                     status = monitor.determine_status(feed_config, current_date, count).value
-                
-                daily_status[current_date.isoformat()] = {
+
+                daily_status[date_key] = {
                     "status": status,
                     "count": count,
-                    "day_of_week": day_name,
-                    "is_weekend": current_date.weekday() >= 5
+                    "day_of_week": _DOW[weekday],
+                    "is_weekend": weekday >= 5
                 }
-                
-                current_date += timedelta(days=1)
             
-            feeds_summary.append(FeedSummaryResponse(
-                feed_name=feed_config.name,
-                daily_status=daily_status
-            ))
+            # {feed_name, daily_status: date -> {status, count, day_of_week, is_weekend}}
+            feeds_summary.append({
+                "feed_name": feed_config.name,
+                "daily_status": daily_status
+            })
         
-        conn.close()
+        with _feeds_status_lock:
+            if _feeds_status_cache['generation'] == generation:
+                _feeds_status_cache.update(payload=feeds_summary, expires=time.monotonic() + FEEDS_STATUS_TTL_SECONDS)
         return feeds_summary
         
     except Exception as e:
@@ -371,7 +541,7 @@ async def get_feeds_status():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/feeds/{feed_name}/status")
-async def get_feed_status(feed_name: str, cob_date: Optional[str] = None):
+def get_feed_status(feed_name: str, cob_date: Optional[str] = None):
     """Get specific feed status for a date"""
     try:
         target_date = datetime.strptime(cob_date, '%Y-%m-%d').date() if cob_date else datetime.now().date() - timedelta(days=1)
@@ -390,7 +560,7 @@ async def get_feed_status(feed_name: str, cob_date: Optional[str] = None):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/feeds/check")
-async def trigger_feed_check():
+def trigger_feed_check():
     """Manually trigger feed check"""
     try:
         monitor.check_all_feeds()
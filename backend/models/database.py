@@ -1,16 +1,29 @@
 # backend/models/database.py - Database connection and models
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Date, Boolean, Text
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, Date, Boolean, Text, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
 from datetime import datetime
+import logging
 import os
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 Base = declarative_base()
 
 class FeedStatus(Base):
     """Model for tracking feed status"""
     __tablename__ = "feed_status"
+    __table_args__ = (
+        # Unique key for status upserts; on PostgreSQL the INCLUDE columns make summary range scans index-only
+        Index(
+            "ix_feed_status_feed_date", "feed_name", "cob_date",
+            unique=True,
+            postgresql_include=["status", "record_count", "last_checked"]
+        ),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     feed_name = Column(String(255), nullable=False)
@@ -74,11 +87,13 @@ class DatabaseManager:
         try:
             self.engine = create_engine(
                 self.database_url,
-                echo=os.getenv("DEBUG", "False").lower() == "true"
+                echo=os.getenv("DEBUG", "False").lower() == "true",
+                **self._engine_options()
             )
             
             # Create all tables
             Base.metadata.create_all(bind=self.engine)
+            self._ensure_status_index()
             
             # Create session factory
             self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
@@ -86,6 +101,27 @@ class DatabaseManager:
         except Exception as e:
             raise Exception(f"Failed to initialize database: {str(e)}")
     
+    def _ensure_status_index(self):
+        """Add the feed_status upsert key to tables created before it existed"""
+        index = next(ix for ix in FeedStatus.__table__.indexes if ix.name == "ix_feed_status_feed_date")
+        try:
+            index.create(bind=self.engine, checkfirst=True)
+        except Exception as e:
+            # Typically duplicate (feed_name, cob_date) rows; status writes fall back to per-row merges
+            logger.warning(f"Could not create {index.name}: {str(e)}")
+    
+    def _engine_options(self) -> dict:
+        """Pool settings for the configured backend"""
+        url = make_url(self.database_url)
+        if url.get_backend_name() == "sqlite":
+            # File databases get a thread-shareable QueuePool; in-memory ones must share a single connection
+            options = {"connect_args": {"check_same_thread": False}}
+            if url.database in (None, "", ":memory:"):
+                options["poolclass"] = StaticPool
+            return options
+        
+        return {"pool_size": 10, "max_overflow": 20, "pool_pre_ping": True}
+    
     def get_session(self):
         """Get database session"""
         if not self.SessionLocal:
@@ -1,19 +1,36 @@
 import smtplib
 import json
 import requests
+from requests.adapters import HTTPAdapter
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import List, Dict, Optional
 from datetime import datetime
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Slack attachment colour per feed status
+_SLACK_COLORS = {
+    'received': 'good',
+    'delayed': 'warning',
+    'missing': 'danger',
+    'partial': 'warning',
+    'failed': 'danger'
+}
+
 class AlertingService:
     def __init__(self, config: Dict):
         self.config = config
         self.email_config = config.get('email', {})
         self.slack_config = config.get('slack', {})
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
+        
+        # Keep-alive session so repeated webhook posts skip the TCP/TLS handshake
+        self._http = requests.Session()
+        self._http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=3))
     
     def send_alert(self, feed_name: str, status: str, cob_date: str, record_count: int, error_message: Optional[str] = None):
         """Send alert for feed status"""
@@ -64,30 +81,59 @@ class AlertingService:
             
             msg.attach(MIMEText(body, 'plain'))
             
-            server = smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port'])
-            server.starttls()
-            
-            if self.email_config.get('username') and self.email_config.get('password'):
-                server.login(self.email_config['username'], self.email_config['password'])
-            
-            server.send_message(msg)
-            server.quit()
+            with self._smtp_lock:
+                try:
+                    self._get_smtp().send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    # Server dropped the connection between checks, reconnect once
+                    self._close_smtp()
+                    self._get_smtp().send_message(msg)
             
             logger.info(f"Email alert sent for {alert_data['feed_name']}")
             
         except Exception as e:
             logger.error(f"Error sending email alert: {e}")
     
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Return an open SMTP connection, reconnecting if the current one is stale"""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close_smtp()
+        
+        server = smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port'])
+        server.starttls()
+        
+        if self.email_config.get('username') and self.email_config.get('password'):
+            server.login(self.email_config['username'], self.email_config['password'])
+        
+        self._smtp = server
+        return server
+    
+    def _close_smtp(self):
+        """Quit the cached SMTP connection, ignoring errors from a dead socket"""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        finally:
+            self._smtp = None
+    
+    def close(self):
+        """Close any open alerting connections"""
+        with self._smtp_lock:
+            self._close_smtp()
+        self._http.close()
+    
     def _send_slack_alert(self, alert_data: Dict):
         """Send Slack alert"""
         try:
-            color = {
-                'received': 'good',
-                'delayed': 'warning',
-                'missing': 'danger',
-                'partial': 'warning',
-                'failed': 'danger'
-            }.get(alert_data['status'], 'danger')
+            color = _SLACK_COLORS.get(alert_data['status'], 'danger')
             
             payload = {
                 "channel": self.slack_config.get('channel', '#data-alerts'),
@@ -132,7 +178,7 @@ class AlertingService:
                     "short": False
                 })
             
-            response = requests.post(self.slack_config['webhook_url'], json=payload)
+            response = self._http.post(self.slack_config['webhook_url'], json=payload, timeout=5)
             response.raise_for_status()
             
             logger.info(f"Slack alert sent for {alert_data['feed_name']}")
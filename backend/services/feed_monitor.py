@@ -1,14 +1,28 @@
+import asyncio
 import logging
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import groupby
+from operator import attrgetter, itemgetter
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, date, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import create_engine, text
+from sqlalchemy import bindparam, create_engine, func, select, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.sql.elements import TextClause
 from models.feed_config import FeedConfig
-from models.database import DatabaseManager, FeedStatus as FeedStatusModel
+from models.database import DatabaseManager, FeedConfiguration, FeedStatus as FeedStatusModel
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Columns refreshed when a feed status row for the same (feed_name, cob_date) already exists
+_UPSERT_COLUMNS = ("status", "record_count", "last_checked", "error_message")
+
+# Day-of-week abbreviations indexed by date.weekday()
+_DOW = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
 class FeedStatus(str, Enum):
     RECEIVED = "received"
     DELAYED = "delayed"
@@ -17,19 +31,90 @@ class FeedStatus(str, Enum):
     FAILED = "failed"
     UNKNOWN = "unknown"
 
+    def __str__(self) -> str:
+        return self.value
+
+# Status by record count: none, below min_records, at or above min_records
+_COUNT_STATUSES = (FeedStatus.MISSING, FeedStatus.PARTIAL, FeedStatus.RECEIVED)
+
 class FeedMonitorService:
+    # Source engines shared by all service instances, keyed by connection string
+    _engines: Dict[str, Engine] = {}
+    _engines_lock = threading.Lock()
+    
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
+        # Source checks block on database I/O, so run them on reusable worker threads
+        self._io_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="feed-io")
+        # Prepared COUNT statements keyed by (table, date column), reused across ticks
+        self._count_stmts: Dict[Tuple[str, str], TextClause] = {}
+        self._range_count_stmts: Dict[Tuple[str, str], TextClause] = {}
+    
+    def _get_engine(self, connection_string: str) -> Engine:
+        """Return the pooled engine for a source database, creating it on first use"""
+        engine = self._engines.get(connection_string)
+        if engine is not None:
+            return engine
+        
+        with self._engines_lock:
+            engine = self._engines.get(connection_string)
+            if engine is None:
+                options = {}
+                if make_url(connection_string).get_backend_name() != "sqlite":
+                    options = {
+                        "pool_size": 5,
+                        "max_overflow": 10,
+                        "pool_pre_ping": True,
+                        "pool_use_lifo": True,
+                        "pool_recycle": 1800
+                    }
+                engine = create_engine(connection_string, **options)
+                self._engines[connection_string] = engine
+            return engine
+    
+    def close(self):
+        """Stop the worker threads and dispose all cached source engines"""
+        self._io_pool.shutdown(wait=True)
+        with self._engines_lock:
+            for engine in self._engines.values():
+                engine.dispose()
+            self._engines.clear()
+    
+    def warm_up(self, feed_configs: Optional[List[FeedConfig]] = None):
+        """Open a pooled connection to every source and prime the COUNT statements
+        
+        Defaults to the active feed configurations stored in the monitoring database.
+        """
+        if feed_configs is None:
+            with self.db_manager.get_session() as session:
+                sources = set(session.execute(
+                    select(
+                        FeedConfiguration.connection_string,
+                        FeedConfiguration.source_table,
+                        FeedConfiguration.date_column
+                    ).where(FeedConfiguration.is_active.is_(True))
+                ))
+        else:
+            sources = {(fc.connection_string, fc.source_table, fc.date_column) for fc in feed_configs}
+        
+        today = date.today()
+        for connection_string, table, column in sources:
+            try:
+                with self._get_engine(connection_string).connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                    conn.execute(self._count_stmt(table, column), {"cob_date": today})
+            except Exception as e:
+                logger.warning(f"Warm-up failed for {table}: {str(e)}")
     
     def check_feed_status(self, feed_config: FeedConfig, cob_date: date) -> dict:
         """Check status of a specific feed for given COB date"""
         try:
-            # Create connection to source database
-            engine = create_engine(feed_config.connection_string)
+            # Reuse the pooled connection to the source database
+            engine = self._get_engine(feed_config.connection_string)
             
             with engine.connect() as conn:
                 # Count records for the COB date
-                query = text(f"SELECT COUNT(*) FROM {feed_config.source_table} WHERE {feed_config.date_column} = :cob_date")
+                query = self._count_stmt(feed_config.source_table, feed_config.date_column)
                 result = conn.execute(query, {"cob_date": cob_date})
                 record_count = result.scalar()
             
@@ -39,109 +124,289 @@ class FeedMonitorService:
             # Update feed status in monitoring database
             self._update_feed_status(feed_config, cob_date, status, record_count)
             
-            return {
-                "feed_name": feed_config.name,
-                "cob_date": cob_date.isoformat(),
-                "status": status.value,
-                "record_count": record_count,
-                "last_updated": datetime.now(),
-                "expected_time": feed_config.expected_time
-            }
+            return self._status_result(feed_config, cob_date, status, record_count)
             
         except Exception as e:
             logger.error(f"Error checking feed {feed_config.name}: {str(e)}")
             self._update_feed_status(feed_config, cob_date, FeedStatus.FAILED, 0, str(e))
             
-            return {
-                "feed_name": feed_config.name,
-                "cob_date": cob_date.isoformat(),
-                "status": FeedStatus.FAILED.value,
-                "record_count": 0,
-                "last_updated": datetime.now(),
-                "expected_time": feed_config.expected_time,
-                "error": str(e)
-            }
+            result = self._status_result(feed_config, cob_date, FeedStatus.FAILED, 0)
+            result["error"] = str(e)
+            return result
+    
+    def check_feeds_bulk(self, feed_configs: List[FeedConfig], cob_dates: List[date]) -> List[dict]:
+        """Check many feeds over several COB dates with one grouped COUNT per source table"""
+        futures = [
+            self._io_pool.submit(self._check_one_source, connection_string, group, cob_dates)
+            for connection_string, group in self._group_by_source(feed_configs)
+        ]
+        
+        results = []
+        for future in as_completed(futures):
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                logger.error(f"Error in bulk feed check: {str(e)}")
+        return results
+    
+    async def check_feeds_bulk_async(self, feed_configs: List[FeedConfig], cob_dates: List[date]) -> List[dict]:
+        """Awaitable check_feeds_bulk for coroutine jobs; blocking DB work stays on the I/O pool"""
+        loop = asyncio.get_running_loop()
+        group_results = await asyncio.gather(*(
+            loop.run_in_executor(self._io_pool, self._check_one_source, connection_string, group, cob_dates)
+            for connection_string, group in self._group_by_source(feed_configs)
+        ), return_exceptions=True)
+        
+        results = []
+        for group_result in group_results:
+            if isinstance(group_result, Exception):
+                logger.error(f"Error in bulk feed check: {str(group_result)}")
+            else:
+                results.extend(group_result)
+        return results
+    
+    @staticmethod
+    def _group_by_source(feed_configs: List[FeedConfig]) -> List[Tuple[str, List[FeedConfig]]]:
+        """Group feed configs by source connection string"""
+        by_connection = attrgetter('connection_string')
+        return [
+            (connection_string, list(group))
+            for connection_string, group in groupby(sorted(feed_configs, key=by_connection), key=by_connection)
+        ]
+    
+    def _check_one_source(self, connection_string: str, feed_configs: List[FeedConfig],
+                          cob_dates: List[date]) -> List[dict]:
+        """Check all feeds that live in one source database"""
+        try:
+            counts, errors = self._count_by_date(
+                self._get_engine(connection_string),
+                {(fc.source_table, fc.date_column) for fc in feed_configs},
+                cob_dates
+            )
+        except Exception as e:
+            # Engine or connection failure: nothing on this source could be counted
+            feed_names = ", ".join(fc.name for fc in feed_configs)
+            logger.error(f"Error checking feeds {feed_names}: {str(e)}")
+            errors = {(fc.source_table, fc.date_column): str(e) for fc in feed_configs}
+            counts = {}
+        
+        rows = []
+        results = []
+        for feed_config in feed_configs:
+            error = errors.get((feed_config.source_table, feed_config.date_column))
+            for cob_date in cob_dates:
+                if error is not None:
+                    rows.append(self._status_row(feed_config, cob_date, FeedStatus.FAILED, 0, error))
+                    result = self._status_result(feed_config, cob_date, FeedStatus.FAILED, 0)
+                    result["error"] = error
+                    results.append(result)
+                    continue
+                
+                record_count = counts.get((feed_config.source_table, feed_config.date_column, cob_date), 0)
+                status = self._determine_status(feed_config, cob_date, record_count)
+                rows.append(self._status_row(feed_config, cob_date, status, record_count))
+                results.append(self._status_result(feed_config, cob_date, status, record_count))
+        self._update_feed_status_many(rows)
+        return results
+    
+    def _count_by_date(self, engine: Engine, tables: set, cob_dates: List[date]
+                       ) -> Tuple[Dict[Tuple[str, str, date], int], Dict[Tuple[str, str], str]]:
+        """Count rows per COB date for each (table, date column) in a single grouped query each
+        
+        Returns the counts plus an error message for each (table, column) whose query failed.
+        """
+        counts = {}
+        errors = {}
+        with engine.connect() as conn:
+            for table, column in tables:
+                query = self._range_count_stmt(table, column)
+                try:
+                    for value, count in conn.execute(query, {"cob_dates": list(cob_dates)}):
+                        counts[(table, column, self._as_date(value))] = count
+                except Exception as e:
+                    logger.error(f"Error counting {table}.{column}: {str(e)}")
+                    errors[(table, column)] = str(e)
+                    # Clear the failed transaction so the remaining tables can still be queried
+                    conn.rollback()
+        return counts, errors
+    
+    def _count_stmt(self, table: str, column: str) -> TextClause:
+        """COUNT(*) for one COB date, built once per (table, column)"""
+        stmt = self._count_stmts.get((table, column))
+        if stmt is None:
+            stmt = text(f"SELECT COUNT(*) FROM {table} WHERE {column} = :cob_date")
+            self._count_stmts[(table, column)] = stmt
+        return stmt
+    
+    def _range_count_stmt(self, table: str, column: str) -> TextClause:
+        """Grouped COUNT(*) over a list of COB dates, built once per (table, column)"""
+        stmt = self._range_count_stmts.get((table, column))
+        if stmt is None:
+            stmt = text(
+                f"SELECT {column}, COUNT(*) FROM {table} WHERE {column} IN :cob_dates GROUP BY {column}"
+            ).bindparams(bindparam("cob_dates", expanding=True))
+            self._range_count_stmts[(table, column)] = stmt
+        return stmt
+    
+    @staticmethod
+    def _as_date(value) -> date:
+        """Normalize a date column value returned by the driver"""
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return date.fromisoformat(str(value)[:10])
+    
+    def _status_result(self, feed_config: FeedConfig, cob_date: date, status: FeedStatus,
+                       record_count: int) -> dict:
+        """Build the status payload returned for a feed check"""
+        return {
+            "feed_name": feed_config.name,
+            "cob_date": cob_date.isoformat(),
+            "status": status.value,
+            "record_count": record_count,
+            "last_updated": datetime.now(),
+            "expected_time": feed_config.expected_time
+        }
     
     def _determine_status(self, feed_config: FeedConfig, cob_date: date, record_count: int) -> FeedStatus:
         """Determine feed status based on configuration and data"""
-        # Check if it's weekend and feed is not expected
+        # Feeds not expected on weekends are always considered received then
         if cob_date.weekday() >= 5 and not feed_config.weekend_expected:
-            return FeedStatus.RECEIVED if record_count == 0 else FeedStatus.RECEIVED
-        
-        # Check minimum records threshold
-        if record_count == 0:
-            return FeedStatus.MISSING
-        elif record_count < feed_config.min_records:
-            return FeedStatus.PARTIAL
-        else:
-            # Check if delayed (would need time comparison logic)
             return FeedStatus.RECEIVED
+        
+        # Check minimum records threshold (delayed would need time comparison logic)
+        index = 0 if record_count == 0 else (1 if record_count < feed_config.min_records else 2)
+        return _COUNT_STATUSES[index]
     
     def _update_feed_status(self, feed_config: FeedConfig, cob_date: date, status: FeedStatus, 
                            record_count: int, error_message: Optional[str] = None):
         """Update feed status in monitoring database"""
+        self._update_feed_status_many([
+            self._status_row(feed_config, cob_date, status, record_count, error_message)
+        ])
+    
+    def _status_row(self, feed_config: FeedConfig, cob_date: date, status: FeedStatus,
+                    record_count: int, error_message: Optional[str] = None) -> dict:
+        """Build a feed_status row for _update_feed_status_many"""
+        return {
+            "feed_name": feed_config.name,
+            "cob_date": cob_date,
+            "status": status.value,
+            "record_count": record_count,
+            # Stamped by the database clock so all app instances agree
+            "last_checked": func.now(),
+            "expected_time": feed_config.expected_time,
+            "error_message": error_message
+        }
+    
+    def _update_feed_status_many(self, rows: List[dict]):
+        """Upsert feed status rows in a single statement"""
+        if not rows:
+            return
+        
         try:
             with self.db_manager.get_session() as session:
-                # Check if record exists
-                existing = session.query(FeedStatusModel).filter(
-                    FeedStatusModel.feed_name == feed_config.name,
-                    FeedStatusModel.cob_date == cob_date
-                ).first()
-                
-                if existing:
-                    existing.status = status.value
-                    existing.record_count = record_count
-                    existing.last_checked = datetime.now()
-                    existing.error_message = error_message
-                else:
-                    new_status = FeedStatusModel(
-                        feed_name=feed_config.name,
-                        cob_date=cob_date,
-                        status=status.value,
-                        record_count=record_count,
-                        last_checked=datetime.now(),
-                        expected_time=feed_config.expected_time,
-                        error_message=error_message
-                    )
-                    session.add(new_status)
-                
+                stmt = self._upsert_statement(rows)
+                if stmt is not None:
+                    try:
+                        session.execute(stmt)
+                    except DBAPIError as e:
+                        # No unique key on (feed_name, cob_date) to conflict on; merge row by row
+                        logger.warning(f"Status upsert failed, merging rows instead: {e}")
+                        session.rollback()
+                        stmt = None
+                if stmt is None:
+                    for row in rows:
+                        self._merge_status_row(session, row)
                 session.commit()
                 
         except Exception as e:
             logger.error(f"Error updating feed status: {e}")
     
+    def _upsert_statement(self, rows: List[dict]):
+        """Build a dialect-specific INSERT ... ON CONFLICT for feed status rows, if supported"""
+        dialect = self.db_manager.engine.dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        elif dialect in ("mysql", "mariadb"):
+            from sqlalchemy.dialects.mysql import insert
+        else:
+            return None
+        
+        stmt = insert(FeedStatusModel).values(rows)
+        if dialect in ("mysql", "mariadb"):
+            return stmt.on_duplicate_key_update(
+                {column: stmt.inserted[column] for column in _UPSERT_COLUMNS}
+            )
+        return stmt.on_conflict_do_update(
+            index_elements=["feed_name", "cob_date"],
+            set_={column: stmt.excluded[column] for column in _UPSERT_COLUMNS}
+        )
+    
+    def _merge_status_row(self, session: Session, row: dict):
+        """Select-then-update fallback for dialects without an upsert"""
+        existing = session.query(FeedStatusModel).filter(
+            FeedStatusModel.feed_name == row["feed_name"],
+            FeedStatusModel.cob_date == row["cob_date"]
+        ).first()
+        
+        if existing:
+            for column in _UPSERT_COLUMNS:
+                setattr(existing, column, row[column])
+        else:
+            session.add(FeedStatusModel(**row))
+    
     def get_feed_summary(self, days: int = 90) -> List[dict]:
         """Get feed status summary for specified number of days"""
         try:
             end_date = datetime.now().date()
             start_date = end_date - timedelta(days=days)
             
+            # Per-date key and weekday fields, computed once per window instead of per row
+            date_meta = {}
+            for offset in range(days + 1):
+                day = start_date + timedelta(days=offset)
+                weekday = day.weekday()
+                date_meta[day] = (day.isoformat(), _DOW[weekday], weekday >= 5)
+            
+            # Fetch only the needed columns as plain rows, ordered so feeds arrive grouped, and
+            # stream them in batches (server-side cursor where supported) rather than loading all at once
+            query = select(
+                FeedStatusModel.feed_name,
+                FeedStatusModel.cob_date,
+                FeedStatusModel.status,
+                FeedStatusModel.record_count
+            ).where(
+                FeedStatusModel.cob_date >= start_date,
+                FeedStatusModel.cob_date <= end_date
+            ).order_by(
+                FeedStatusModel.feed_name, FeedStatusModel.cob_date
+            ).execution_options(stream_results=True, yield_per=1000)
+            
             with self.db_manager.get_session() as session:
-                results = session.query(FeedStatusModel).filter(
-                    FeedStatusModel.cob_date >= start_date,
-                    FeedStatusModel.cob_date <= end_date
-                ).all()
+                rows = session.execute(query)
                 
-                # Group by feed name
-                feed_data = {}
-                for result in results:
-                    if result.feed_name not in feed_data:
-                        feed_data[result.feed_name] = {}
+                summary = []
+                for feed_name, feed_rows in groupby(rows, key=itemgetter(0)):
+                    daily_status = {}
+                    for _, cob_date, status, record_count in feed_rows:
+                        date_key, day_of_week, is_weekend = date_meta[cob_date]
+                        daily_status[date_key] = {
+                            "status": status,
+                            "count": record_count,
+                            "day_of_week": day_of_week,
+                            "is_weekend": is_weekend
+                        }
                     
-                    feed_data[result.feed_name][result.cob_date.isoformat()] = {
-                        "status": result.status,
-                        "count": result.record_count,
-                        "day_of_week": result.cob_date.strftime('%a'),
-                        "is_weekend": result.cob_date.weekday() >= 5
-                    }
-                
-                return [
-                    {
+                    summary.append({
                         "feed_name": feed_name,
                         "daily_status": daily_status
-                    }
-                    for feed_name, daily_status in feed_data.items()
-                ]
+                    })
+                
+                return summary
                 
         except Exception as e:
             logger.error(f"Error getting feed summary: {e}")
@@ -1,3 +1,4 @@
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
@@ -8,8 +9,10 @@ import logging
 logger = logging.getLogger(__name__)
 
 class SchedulerService:
-    def __init__(self):
-        self.scheduler = BackgroundScheduler()
+    def __init__(self, use_asyncio: bool = False):
+        # AsyncIOScheduler runs coroutine jobs on the running event loop, so start() must be
+        # called from inside it (e.g. a FastAPI startup handler)
+        self.scheduler = AsyncIOScheduler() if use_asyncio else BackgroundScheduler()
         self.jobs = {}
     
     def start(self):
@@ -102,10 +105,12 @@ class SchedulerService:
     
     def get_jobs(self) -> List[dict]:
         """Get list of all jobs"""
+        # Snapshot next run times in one jobstore sweep; pending jobs have none until the scheduler starts
+        next_runs = {job.id: getattr(job, 'next_run_time', None) for job in self.scheduler.get_jobs()}
         return [
             {
                 "job_id": job_id,
-                "next_run": self.scheduler.get_job(job_id).next_run_time.isoformat() if self.scheduler.get_job(job_id) else None,
+                "next_run": next_runs[job_id].isoformat() if next_runs.get(job_id) else None,
                 **job_info
             }
             for job_id, job_info in self.jobs.items()
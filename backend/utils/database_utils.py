@@ -1,10 +1,19 @@
 import logging
+from datetime import date
 from typing import List, Dict, Any, Optional
 from sqlalchemy import create_engine, text, MetaData, Table
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
 import pandas as pd
 
+try:
+    # Optional Arrow fast path; connectorx's Arrow output also needs pyarrow
+    import connectorx as cx
+    import pyarrow  # noqa: F401
+except ImportError:
+    cx = None
+
 logger = logging.getLogger(__name__)
 
 class DatabaseUtils:
@@ -70,7 +79,11 @@ class DatabaseUtils:
             return 0
     
     def get_date_range_data(self, table_name: str, date_column: str, start_date: str, end_date: str) -> pd.DataFrame:
-        """Get data for a date range as DataFrame"""
+        """Get data for a date range as DataFrame
+        
+        Column dtypes depend on the read path: the connectorx fast path returns Arrow-backed
+        columns (e.g. date32[pyarrow], int64[pyarrow]), the SQLAlchemy fallback numpy/object ones.
+        """
         try:
             query = f"""
             SELECT {date_column}, COUNT(*) as record_count
@@ -80,6 +93,12 @@ class DatabaseUtils:
             ORDER BY {date_column}
             """
             
+            if cx is not None:
+                try:
+                    return self._read_arrow(query, start_date, end_date)
+                except Exception as e:
+                    logger.warning(f"connectorx read failed, falling back to SQLAlchemy: {e}")
+            
             with self.engine.connect() as conn:
                 df = pd.read_sql(query, conn, params={"start_date": start_date, "end_date": end_date})
             
@@ -88,6 +107,23 @@ class DatabaseUtils:
             logger.error(f"Error getting date range data: {e}")
             return pd.DataFrame()
     
+    def _read_arrow(self, query: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """Run a date-range query through connectorx straight into Arrow-backed columns"""
+        # connectorx takes no bind parameters, so inline the dates after validating them as ISO dates
+        literals = {
+            "start_date": f"'{date.fromisoformat(str(start_date)).isoformat()}'",
+            "end_date": f"'{date.fromisoformat(str(end_date)).isoformat()}'"
+        }
+        for name, literal in literals.items():
+            query = query.replace(f":{name}", literal)
+        
+        # connectorx expects bare backend schemes such as postgresql:// rather than postgresql+psycopg2://
+        url = make_url(self.connection_string)
+        cx_url = url.set(drivername=url.get_backend_name()).render_as_string(hide_password=False)
+        
+        table = cx.read_sql(cx_url, query, return_type="arrow")
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    
     def close(self):
         """Close database connection"""
         self.engine.dispose()
\ No newline at end of file
@@ -1,11 +1,18 @@
 from datetime import datetime, date, timedelta, time
-from typing import List, Optional, Union
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Set, Tuple, Union
+import numpy as np
 import pytz
 from dateutil.parser import parse
 import logging
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=16)
+def _holiday_set(holidays: Tuple[str, ...]) -> FrozenSet[str]:
+    """Frozen set of a holiday calendar, built once per distinct tuple"""
+    return frozenset(holidays)
+
 class DateUtils:
     @staticmethod
     def get_business_days(start_date: Union[str, date], end_date: Union[str, date]) -> List[date]:
@@ -15,15 +22,9 @@ class DateUtils:
         if isinstance(end_date, str):
             end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
         
-        business_days = []
-        current_date = start_date
-        
-        while current_date <= end_date:
-            if current_date.weekday() < 5:  # Monday = 0, Sunday = 6
-                business_days.append(current_date)
-            current_date += timedelta(days=1)
-        
-        return business_days
+        # Enumerate the range as datetime64 and keep Monday-Friday in one vectorized pass
+        days = np.arange(np.datetime64(start_date, 'D'), np.datetime64(end_date, 'D') + 1)
+        return days[np.is_busday(days)].tolist()
     
     @staticmethod
     def is_business_day(target_date: Union[str, date]) -> bool:
@@ -34,11 +35,18 @@ class DateUtils:
         return target_date.weekday() < 5
     
     @staticmethod
-    def is_holiday(target_date: Union[str, date], holidays: List[str]) -> bool:
-        """Check if a date is a holiday"""
+    def is_holiday(target_date: Union[str, date],
+                   holidays: Union[Set[str], FrozenSet[str], Tuple[str, ...], List[str]]) -> bool:
+        """Check if a date is a holiday
+        
+        Pass a set or tuple for O(1) lookups; tuples are converted to a cached frozenset.
+        """
         if isinstance(target_date, date):
             target_date = target_date.isoformat()
         
+        if isinstance(holidays, tuple):
+            holidays = _holiday_set(holidays)
+        
         return target_date in holidays
     
     @staticmethod
@@ -47,12 +55,8 @@ class DateUtils:
         if isinstance(target_date, str):
             target_date = datetime.strptime(target_date, '%Y-%m-%d').date()
         
-        previous_day = target_date - timedelta(days=1)
-        
-        while previous_day.weekday() >= 5:  # Skip weekends
-            previous_day -= timedelta(days=1)
-        
-        return previous_day
+        # Roll weekend dates forward to Monday so stepping back one lands on Friday
+        return np.busday_offset(np.datetime64(target_date, 'D'), -1, roll='forward').item()
     
     @staticmethod
     def get_cob_date(timezone_str: str = 'UTC') -> date:
@@ -67,6 +71,7 @@ class DateUtils:
             return now.date()
     
     @staticmethod
+    @lru_cache(maxsize=512)
     def parse_time_string(time_str: str) -> time:
         """Parse time string to time object"""
         try:
@@ -78,45 +83,45 @@ class DateUtils:
     
     @staticmethod
     def is_within_tolerance(expected_time: str, actual_time: datetime, tolerance_minutes: int) -> bool:
-        """Check if actual time is within tolerance of expected time"""
+        """Check if actual time is within tolerance of expected time
+        
+        Compares seconds since midnight, so windows that cross midnight wrap around.
+        """
         try:
-            expected = DateUtils.parse_time_string(expected_time)
-            actual_time_only = actual_time.time()
-            
-            # Calculate tolerance window
-            expected_dt = datetime.combine(actual_time.date(), expected)
-            tolerance_delta = timedelta(minutes=tolerance_minutes)
+            expected_seconds = DateUtils._seconds_of_day(expected_time)
+            actual_seconds = actual_time.hour * 3600 + actual_time.minute * 60 + actual_time.second
             
-            start_window = expected_dt - tolerance_delta
-            end_window = expected_dt + tolerance_delta
-            
-            return start_window <= actual_time <= end_window
+            diff = abs(actual_seconds - expected_seconds)
+            return min(diff, 86400 - diff) <= tolerance_minutes * 60
         except Exception as e:
             logger.error(f"Error checking time tolerance: {e}")
             return False
     
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _seconds_of_day(time_str: str) -> int:
+        """Seconds since midnight for an HH:MM string, cached per feed schedule"""
+        parsed = DateUtils.parse_time_string(time_str)
+        return parsed.hour * 3600 + parsed.minute * 60
+    
     @staticmethod
     def format_duration(minutes: int) -> str:
         """Format duration in minutes to human readable format"""
         if minutes < 60:
             return f"{minutes}m"
-        elif minutes < 1440:  # Less than 24 hours
-            hours = minutes // 60
-            mins = minutes % 60
-            return f"{hours}h {mins}m" if mins > 0 else f"{hours}h"
-        else:
-            days = minutes // 1440
-            remaining_minutes = minutes % 1440
-            hours = remaining_minutes // 60
-            mins = remaining_minutes % 60
-            
-            result = f"{days}d"
-            if hours > 0:
-                result += f" {hours}h"
-            if mins > 0:
-                result += f" {mins}m"
-            
-            return result
+        
+        days, remaining_minutes = divmod(minutes, 1440)
+        hours, mins = divmod(remaining_minutes, 60)
+        
+        parts = []
+        if days:
+            parts.append(f"{days}d")
+        if hours:
+            parts.append(f"{hours}h")
+        if mins:
+            parts.append(f"{mins}m")
+        
+        return " ".join(parts)
     
     @staticmethod
     def get_date_range(days: int) -> tuple: